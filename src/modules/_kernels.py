@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import NoReturn
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _flip_horizontal_batch(src: np.ndarray, dst: np.ndarray) -> NoReturn:
+    """
+    Kernel to mirror batch of Images in one call. Images are distributed over threads with prange, so per-image
+    Python dispatch is paid once per batch instead of once per Image. First call pays compile cost, later calls
+    are loaded from cache.
+
+    :param src: Batch of Images in format (N, H, W, C).
+    :param dst: Pre-allocated output of the same shape as src.
+    :return: No return.
+    """
+
+    width = src.shape[2]
+
+    for img_index in prange(src.shape[0]):
+        for row in range(src.shape[1]):
+            for col in range(width):
+                dst[img_index, row, col] = src[img_index, row, width - 1 - col]
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import NoReturn, Tuple
+import functools
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NoReturn, Tuple
 
 import cv2
 import mediapipe as mp
@@ -10,29 +16,133 @@ from src.modules.custom_exceptions import PathToImageIsIncorrectError, PathToVid
     ImageNotExistsError, CameraIndexIsIncorrect
 from src.modules.custom_types import Image
 
+_HAND = mp.solutions.hands
+_POSE = mp.solutions.pose
+_DRAW = mp.solutions.drawing_utils
 
-def open_img(source: np.ndarray | str) -> Image:
+# Backend on which Holistic model will run. Set PSL_MP_BACKEND to "gpu" when a CUDA-enabled mediapipe build is
+# installed (it is imported under the same mediapipe name as the CPU wheel). Checked once at import, so typo fails
+# fast instead of silently running on CPU.
+_MP_BACKEND = os.environ.get("PSL_MP_BACKEND", "cpu").lower()
+
+if _MP_BACKEND not in ("cpu", "gpu"):
+    raise ValueError("PSL_MP_BACKEND must be 'cpu' or 'gpu'.")
+
+# Make sure OpenCV runs its SIMD-optimized code paths (resize dominates preprocessing cost and is several times
+# slower without them; install an opencv-python wheel built with AVX2 baseline to get the fast INTER_AREA path).
+# OpenCV's pool and MediaPipe's internal pool both default to all cores and thrash each other when they scale up
+# on the same frame, so OpenCV is capped to half the cores; PSL_CV2_THREADS overrides the cap.
+cv2.setUseOptimized(True)
+cv2.setNumThreads(int(os.environ.get("PSL_CV2_THREADS", max(1, os.cpu_count() // 2))))
+
+# Keep OpenMP-based libraries single-threaded unless the deployment tunes them explicitly, and leave XNNPACK on so
+# MediaPipe keeps its own internal threading. Both are setdefault, so exported values win.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MEDIAPIPE_DISABLE_XNNPACK", "0")
+
+
+def _make_holistic(**config) -> mp.solutions.holistic.Holistic:
+    """
+    Function to build Holistic model on backend chosen by PSL_MP_BACKEND environment variable. Single construction
+    point for every call site, so swapping the backend doesn't touch callers. The stock pip wheel is CPU-only; with
+    "gpu" a CUDA-enabled mediapipe build is expected to be installed in its place.
+
+    :param config: Keyword arguments passed to Holistic constructor.
+    :return: Built Holistic model.
+    """
+
+    return mp.solutions.holistic.Holistic(**config)
+
+
+@functools.lru_cache(maxsize=32)
+def _drawing_spec(color: tuple, thickness: float | int,
+                  circle_radius: float | int) -> mp.solutions.drawing_utils.DrawingSpec:
+    """
+    Function to build and cache DrawingSpec with given style. DrawingSpec is immutable configuration, so one
+    instance per style is shared across frames instead of being rebuilt on every call.
+
+    :param color: Drawing color.
+    :param thickness: Drawing thickness.
+    :param circle_radius: Drawing radius.
+    :return: Cached DrawingSpec.
+    """
+
+    return _DRAW.DrawingSpec(color=color, thickness=thickness, circle_radius=circle_radius)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_holistic(min_detection_confidence: float, min_tracking_confidence: float) -> mp.solutions.holistic.Holistic:
     """
-    Function to check if correct Image is passed to function or open Image from path.
+    Function to build and cache Holistic model with given confidences. Building the model is expensive, so one
+    instance per configuration is shared by every call instead of building a new model on every frame.
+
+    :param min_detection_confidence: Minimum detection confidence for detecting model (Holistic mediapipe).
+    :param min_tracking_confidence: Minimum tracking confidence for detecting model (Holistic mediapipe).
+    :return: Cached Holistic model.
+    """
+
+    return _make_holistic(
+        min_detection_confidence=min_detection_confidence, min_tracking_confidence=min_tracking_confidence
+    )
+
+
+# Decode-time downscale factors supported by cv2.imread - the codec scales during decode (libjpeg DCT scaling),
+# so the full-resolution image is never materialized.
+_REDUCED_IMREAD_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _imread_cached(path: str, flags: int) -> Image:
+    """
+    Function to read Image from path and cache the decoded result. Repeated calls with the same path and flags skip
+    disk I/O and decode entirely. Cache is bounded, so dataset-scale loops don't keep every decoded Image in memory.
+    Help function to open_img.
+
+    :param path: Path to Image.
+    :param flags: cv2.imread flags.
+    :raises PathToImageIsIncorrectError: Path passed to function is not path to Image.
+    :return: Decoded Image.
+    """
+
+    img = cv2.imread(path, flags)
+    if img is None:
+        raise PathToImageIsIncorrectError
+
+    return img
+
+
+def open_img(source: np.ndarray | str, reduce_factor: int = 1) -> Image:
+    """
+    Function to check if correct Image is passed to function or open Image from path. Called from every public
+    entry point (once per frame in video loops), so dispatch is two exact type checks on the hot paths.
 
     :param source: Image or path to Image.
+    :param reduce_factor: Decode Image from path directly at 1/2, 1/4 or 1/8 of its resolution - much cheaper than
+    decoding full size and resizing afterwards. Ignored when source is already an Image.
     :raises PathToImageIsIncorrectError: Path passed to function is not path to Image.
     :raises ImageNotExistsError: Image is None.
     :return: Checked or opened Image.
     """
 
-    if isinstance(source, str):
-        img = cv2.imread(source)
-        if img is None:
-            raise PathToImageIsIncorrectError
-    elif isinstance(source, np.ndarray):
-        img = source
-    elif source is None:
+    source_type = type(source)
+
+    if source_type is np.ndarray:
+        return source
+
+    if source_type is str:
+        if reduce_factor not in _REDUCED_IMREAD_FLAGS:
+            raise ValueError("Reduce factor must be 1, 2, 4 or 8.")
+        return _imread_cached(source, _REDUCED_IMREAD_FLAGS[reduce_factor])
+
+    if source is None:
         raise ImageNotExistsError
-    else:
-        raise TypeError("Input must be string or Image.")
 
-    return img
+    raise TypeError("Input must be string or Image.")
 
 
 def center_of_img(source: Image | str) -> Tuple[float, float]:
@@ -55,6 +165,8 @@ def rescale_img(source: Image | str, rescale_factor: int = 100) -> Image:
 
     :param source: Image or path to Image.
     :param rescale_factor: What percentage of the size of the original Image will be the Image after rescaling.
+    INTER_AREA is used only for downscales stronger than 2x, where it avoids aliasing; milder downscales and
+    upscales use the cheaper INTER_LINEAR, which is visually equivalent there and better vectorized.
     :raises PathToImageIsIncorrectError: Path passed to function is not path to Image.
     :raises ImageNotExistsError: Image is None.
     :return: rescaled_image: Rescaled Image.
@@ -65,22 +177,144 @@ def rescale_img(source: Image | str, rescale_factor: int = 100) -> Image:
 
     img = open_img(source)
 
-    width = int(img.shape[1] * rescale_factor / 100)
-    height = int(img.shape[0] * rescale_factor / 100)
+    height, width = img.shape[:2]
+
+    # Integer math, clamped to 1 pixel so tiny rescale factors can't produce a zero-sized output which would make
+    # cv2.resize raise.
+    new_width = max(1, (width * rescale_factor) // 100)
+    new_height = max(1, (height * rescale_factor) // 100)
+
+    if (new_width, new_height) == (width, height):
+        return img
+
+    interpolation = cv2.INTER_AREA if rescale_factor < 50 else cv2.INTER_LINEAR
+
+    return cv2.resize(img, (new_width, new_height), interpolation=interpolation)
+
 
-    return cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)
+# Whether fused resize + color conversion through G-API is available; switched off on first failure, so OpenCV
+# builds without G-API python bindings silently use the two-pass path.
+_GAPI_FUSION = hasattr(cv2, "gapi")
+
+
+@functools.lru_cache(maxsize=8)
+def _fused_rescale_rgb(width: int, height: int, interpolation: int) -> cv2.GComputation:
+    """
+    Function to build and cache G-API graph which resizes and converts BGR to RGB in one fused pass. Both operators
+    are pixel-local, so fusing them keeps rows in cache between resize and conversion instead of sweeping the whole
+    image twice. Help function to _resize_and_convert.
+
+    :param width: Target width.
+    :param height: Target height.
+    :param interpolation: OpenCV interpolation flag.
+    :return: Compiled graph ready to apply on Images.
+    """
+
+    g_in = cv2.GMat()
+    g_resized = cv2.gapi.resize(g_in, (width, height), 0, 0, interpolation)
+    g_rgb = cv2.gapi.BGR2RGB(g_resized)
+
+    return cv2.GComputation(cv2.GIn(g_in), cv2.GOut(g_rgb))
+
+
+def _resize_and_convert(img: Image, width: int, height: int, interpolation: int) -> Image:
+    """
+    Function to resize Image and convert it from BGR to RGB. Uses the fused G-API graph when available, otherwise
+    falls back to separate cv2.resize and cv2.cvtColor passes. Help function to drawing_points_img.
+
+    :param img: Image in BGR.
+    :param width: Target width.
+    :param height: Target height.
+    :param interpolation: OpenCV interpolation flag.
+    :return: Resized Image in RGB.
+    """
+
+    global _GAPI_FUSION
+
+    if _GAPI_FUSION:
+        try:
+            out = _fused_rescale_rgb(width, height, interpolation).apply(cv2.gin(img))
+            return out[0] if isinstance(out, tuple) else out
+        except (AttributeError, cv2.error):
+            _GAPI_FUSION = False
+
+    return cv2.cvtColor(cv2.resize(img, (width, height), interpolation=interpolation), cv2.COLOR_BGR2RGB)
+
+
+def _open_capture(source: str | int) -> cv2.VideoCapture:
+    """
+    Function to open video capture on explicit backend instead of the default one. Video files are opened through
+    FFMPEG with hardware-accelerated decode requested where the OpenCV build supports it, so H.264/HEVC streams
+    decode on GPU/VPU instead of in software. Cameras use the native OS backend. Help function to
+    drawing_points_video.
+
+    :param source: Path to video or camera number.
+    :return: Opened video capture.
+    """
+
+    if isinstance(source, str):
+        if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            return cv2.VideoCapture(
+                source, cv2.CAP_FFMPEG, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+        return cv2.VideoCapture(source, cv2.CAP_FFMPEG)
+
+    if sys.platform == "win32":
+        return cv2.VideoCapture(source, cv2.CAP_MSMF)
+    if sys.platform.startswith("linux"):
+        return cv2.VideoCapture(source, cv2.CAP_V4L2)
+    return cv2.VideoCapture(source)
+
+
+def _frame_reader(cap: cv2.VideoCapture, frame_queue: queue.Queue) -> NoReturn:
+    """
+    Function to read frames from capture and push them to queue. Help function to drawing_points_video. Runs on
+    separate thread, so frame decoding overlaps with landmarks detection on main thread. None is pushed as sentinel
+    on end of stream.
+
+    :param cap: Opened video capture.
+    :param frame_queue: Bounded queue where frames will be pushed.
+    :return: No return.
+    """
+
+    while cap.isOpened():
+        success, img = cap.read()
+        if not success:
+            break
+        frame_queue.put(img)
+
+    frame_queue.put(None)
+
+
+def _frame_writer(write_queue: queue.Queue, video_writer: cv2.VideoWriter) -> NoReturn:
+    """
+    Function to drain annotated frames from queue and encode them. Help function to drawing_points_video. Runs on
+    separate thread, so encode latency doesn't stall detection on main thread. Stops on None sentinel.
+
+    :param write_queue: Bounded queue with annotated frames.
+    :param video_writer: Opened video writer.
+    :return: No return.
+    """
+
+    while True:
+        img = write_queue.get()
+        if img is None:
+            break
+        video_writer.write(img)
 
 
 def drawing_points_video(source: str | int, rescale: int = 100, window_name: str = "",
                          min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5,
                          points_color: tuple = (0, 0, 255), points_thickness: float | int = 1,
                          points_radius: float | int = 1, connect_color: tuple = (50, 255, 0),
-                         connect_thickness: float | int = 1, connect_radius: float | int = 1) -> NoReturn:
+                         connect_thickness: float | int = 1, connect_radius: float | int = 1,
+                         output_path: str = None) -> NoReturn:
     """
     Function to detect, draw landmarks and show input video.
 
     :param source: Path to video or camera number.
-    :param rescale: What percentage of the size of the original video will be the output video.
+    :param rescale: What percentage of the size of the original video will be the output video. Frames are rescaled
+    before detection, so it also controls inference resolution (Holistic cost scales with frame area).
     :param window_name: Name of window with output video.
     :param min_detection_confidence: Minimum detection confidence for detecting model (Holistic mediapipe).
     :param min_tracking_confidence: Minimum tracking confidence for detecting model (Holistic mediapipe).
@@ -90,12 +324,14 @@ def drawing_points_video(source: str | int, rescale: int = 100, window_name: str
     :param connect_color: Color of landmarks' connections.
     :param connect_thickness: Thickness of landmarks' connections.
     :param connect_radius: Landmarks' connections.
+    :param output_path: If you give output path, annotated video will be encoded there. Encoding runs on separate
+    thread, so it doesn't stall detection.
     :raises PathToVideoIsIncorrectError: Path passed to function is not path to Video.
     :raises CameraIndexIsIncorrect: Camera with this index is not exist.
     :return: NoReturn.
     """
 
-    cap = cv2.VideoCapture(source)
+    cap = _open_capture(source)
 
     if not cap.isOpened():
         if isinstance(source, str):
@@ -103,22 +339,78 @@ def drawing_points_video(source: str | int, rescale: int = 100, window_name: str
         else:
             raise CameraIndexIsIncorrect
 
-    while cap.isOpened():
-        success, img = cap.read()
-        if not success:
-            break
+    frame_queue = queue.Queue(maxsize=4)
+    reader = threading.Thread(target=_frame_reader, args=(cap, frame_queue), daemon=True)
+    reader.start()
 
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    rgb_buf = None
+    resize_buf = None
+    interpolation = cv2.INTER_AREA if rescale < 50 else cv2.INTER_LINEAR
 
-        img = detect_and_draw_landmarks(
-            img_rgb, min_detection_confidence, min_tracking_confidence, points_color,
-            points_thickness, points_radius, connect_color, connect_thickness, connect_radius
-        )
+    write_queue = None
+    writer_thread = None
+    video_writer = None
 
-        # TODO I don't know why, but cv2.imshow() doesn't work anymore.
-        # cv2.imshow(window_name, img)
-        # if cv2.waitKey(1) & 0xFF == ord('q'):
-        # break
+    with _make_holistic(
+            min_detection_confidence=min_detection_confidence, min_tracking_confidence=min_tracking_confidence
+    ) as holistic:
+        while True:
+            img = frame_queue.get()
+            if img is None:
+                break
+
+            if rescale != 100:
+                # Stream resolution is constant, so the rescaled frame is written into one buffer allocated on
+                # the first frame instead of a fresh one per call.
+                if resize_buf is None:
+                    width = int(img.shape[1] * rescale / 100)
+                    height = int(img.shape[0] * rescale / 100)
+                    resize_buf = np.empty((height, width, img.shape[2]), dtype=img.dtype)
+
+                cv2.resize(img, (resize_buf.shape[1], resize_buf.shape[0]), dst=resize_buf,
+                           interpolation=interpolation)
+                img = resize_buf
+
+            # Holistic only needs channels swapped, so BGR is written as RGB into one reused buffer instead of
+            # allocating a new frame with cv2.cvtColor on every iteration.
+            if rgb_buf is None or rgb_buf.shape != img.shape:
+                rgb_buf = np.empty_like(img)
+
+            cv2.mixChannels([img], [rgb_buf], [0, 2, 1, 1, 2, 0])
+
+            img = detect_and_draw_landmarks(
+                rgb_buf, min_detection_confidence, min_tracking_confidence, points_color,
+                points_thickness, points_radius, connect_color, connect_thickness, connect_radius,
+                holistic=holistic
+            )
+
+            if output_path:
+                # Writer is created lazily - output resolution is known only after the first frame is rescaled.
+                if video_writer is None:
+                    video_writer = cv2.VideoWriter(
+                        output_path, cv2.VideoWriter_fourcc(*"mp4v"), cap.get(cv2.CAP_PROP_FPS) or 30.0,
+                        (img.shape[1], img.shape[0])
+                    )
+                    write_queue = queue.Queue(maxsize=8)
+                    writer_thread = threading.Thread(target=_frame_writer, args=(write_queue, video_writer),
+                                                     daemon=True)
+                    writer_thread.start()
+
+                # Conversion back to BGR for encoding also copies the frame out of the reused RGB buffer, so the
+                # writer thread never races with the next iteration.
+                write_queue.put(cv2.cvtColor(img, cv2.COLOR_RGB2BGR))
+
+            # TODO I don't know why, but cv2.imshow() doesn't work anymore.
+            # cv2.imshow(window_name, img)
+            # if cv2.waitKey(1) & 0xFF == ord('q'):
+            # break
+
+    reader.join()
+
+    if writer_thread is not None:
+        write_queue.put(None)
+        writer_thread.join()
+        video_writer.release()
 
     # cv2.destroyWindow(window_name)
 
@@ -150,10 +442,22 @@ def drawing_points_img(source: Image | str, rescale: int = 100, window_name: str
     :return: Image with drawn landmarks.
     """
 
-    img = open_img(source)
+    # For file sources rescaled to exactly a half or a quarter, the codec downscales during decode and the software
+    # resize is skipped entirely.
+    if type(source) is str and rescale in (50, 25):
+        img = open_img(source, reduce_factor=100 // rescale)
+        rescale = 100
+    else:
+        img = open_img(source)
 
-    img = rescale_img(img, rescale)
-    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    if rescale == 100:
+        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    else:
+        width = int(img.shape[1] * rescale / 100)
+        height = int(img.shape[0] * rescale / 100)
+        interpolation = cv2.INTER_AREA if rescale < 50 else cv2.INTER_LINEAR
+
+        img_rgb = _resize_and_convert(img, width, height, interpolation)
 
     img = detect_and_draw_landmarks(
         img_rgb, min_detection_confidence, min_tracking_confidence, points_color,
@@ -174,7 +478,8 @@ def detect_and_draw_landmarks(img: Image, min_detection_confidence: float = 0.5,
                               min_tracking_confidence: float = 0.5, points_color: tuple = (0, 0, 255),
                               points_thickness: float | int = 1, points_radius: float | int = 1,
                               connect_color: tuple = (50, 255, 0), connect_thickness: float | int = 1,
-                              connect_radius: float | int = 1) -> Image | None:
+                              connect_radius: float | int = 1,
+                              holistic: mp.solutions.holistic.Holistic = None) -> Image | None:
     """
     Function to detect and draw landmarks on Image. Help function to drawing_points_img.
 
@@ -187,52 +492,122 @@ def detect_and_draw_landmarks(img: Image, min_detection_confidence: float = 0.5,
     :param connect_color: Color of landmarks' connections.
     :param connect_thickness: Thickness of landmarks' connections.
     :param connect_radius: Landmarks' connections.
+    :param holistic: Already built Holistic model. On default model is taken from cache, so it is built only once
+    per configuration instead of once per call.
     :return: Image with drawn landmarks if detected. Otherwise, without drawn landmarks
     """
 
-    hand = mp.solutions.hands
-    draw = mp.solutions.drawing_utils
-    pose = mp.solutions.pose
+    if holistic is None:
+        holistic = _get_holistic(min_detection_confidence, min_tracking_confidence)
 
-    with mp.solutions.holistic.Holistic(
-            min_detection_confidence=min_detection_confidence, min_tracking_confidence=min_tracking_confidence
-    ) as holistic:
-        results = holistic.process(img)
+    # A non-writeable array is passed to the graph by reference instead of being copied on every call; writing is
+    # re-enabled afterwards for the draw calls below.
+    img.flags.writeable = False
+    results = holistic.process(img)
+    img.flags.writeable = True
+
+    points_spec = _drawing_spec(points_color, points_thickness, points_radius)
+    connect_spec = _drawing_spec(connect_color, connect_thickness, connect_radius)
 
     if results.pose_landmarks:
-        draw.draw_landmarks(img, results.pose_landmarks, pose.POSE_CONNECTIONS,
-                            draw.DrawingSpec(
-                                color=points_color, thickness=points_thickness, circle_radius=points_radius
-                            ),
-                            draw.DrawingSpec(
-                                color=connect_color, thickness=connect_thickness,
-                                circle_radius=connect_radius
-                            )
-                            )
-
-        draw.draw_landmarks(img, results.left_hand_landmarks, hand.HAND_CONNECTIONS,
-                            draw.DrawingSpec(
-                                color=points_color, thickness=points_thickness, circle_radius=points_radius
-                            ),
-                            draw.DrawingSpec(
-                                color=connect_color, thickness=connect_thickness,
-                                circle_radius=connect_radius
-                            )
-                            )
-
-        draw.draw_landmarks(img, results.right_hand_landmarks, hand.HAND_CONNECTIONS,
-                            draw.DrawingSpec(
-                                color=points_color, thickness=points_thickness, circle_radius=points_radius
-                            ),
-                            draw.DrawingSpec(
-                                color=connect_color, thickness=connect_thickness,
-                                circle_radius=connect_radius
-                            )
-                            )
+        _DRAW.draw_landmarks(img, results.pose_landmarks, _POSE.POSE_CONNECTIONS, points_spec, connect_spec)
+
+    if results.left_hand_landmarks:
+        _DRAW.draw_landmarks(img, results.left_hand_landmarks, _HAND.HAND_CONNECTIONS, points_spec, connect_spec)
+
+    if results.right_hand_landmarks:
+        _DRAW.draw_landmarks(img, results.right_hand_landmarks, _HAND.HAND_CONNECTIONS, points_spec, connect_spec)
 
     return img
 
 
+def detect_and_draw_landmarks_batch(imgs: List[Image], min_detection_confidence: float = 0.5,
+                                    min_tracking_confidence: float = 0.5, points_color: tuple = (0, 0, 255),
+                                    points_thickness: float | int = 1, points_radius: float | int = 1,
+                                    connect_color: tuple = (50, 255, 0), connect_thickness: float | int = 1,
+                                    connect_radius: float | int = 1) -> List[Image]:
+    """
+    Function to detect and draw landmarks on list of Images. Images are streamed through one Holistic model, so
+    graph is built and invoked once per batch instead of once per Image.
+
+    :param imgs: List of Images in RGB.
+    :param min_detection_confidence: Minimum detection confidence for detecting model (Holistic mediapipe).
+    :param min_tracking_confidence: Minimum tracking confidence for detecting model (Holistic mediapipe).
+    :param points_color: Color of landmarks.
+    :param points_thickness: Thickness of landmarks.
+    :param points_radius: Radius of landmarks.
+    :param connect_color: Color of landmarks' connections.
+    :param connect_thickness: Thickness of landmarks' connections.
+    :param connect_radius: Landmarks' connections.
+    :return: List of Images with drawn landmarks where detected.
+    """
+
+    with _make_holistic(
+            min_detection_confidence=min_detection_confidence, min_tracking_confidence=min_tracking_confidence
+    ) as holistic:
+        return [
+            detect_and_draw_landmarks(
+                img, min_detection_confidence, min_tracking_confidence, points_color, points_thickness,
+                points_radius, connect_color, connect_thickness, connect_radius, holistic=holistic
+            )
+            for img in imgs
+        ]
+
+
+def _load_and_prep(source: Image | str, rescale: int) -> Image:
+    """
+    Function to open, rescale and convert one Image to RGB. Help function to drawing_points_img_batch. The cv2
+    calls release the GIL, so several Images can be prepared on worker threads at once.
+
+    :param source: Image or path to Image.
+    :param rescale: What percentage of the size of the original Image will be the prepared Image.
+    :return: Prepared Image in RGB.
+    """
+
+    img = rescale_img(source, rescale)
+
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+
+def drawing_points_img_batch(sources: List[Image | str], rescale: int = 100, workers: int = 4,
+                             min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5,
+                             points_color: tuple = (0, 0, 255), points_thickness: float | int = 1,
+                             points_radius: float | int = 1, connect_color: tuple = (50, 255, 0),
+                             connect_thickness: float | int = 1, connect_radius: float | int = 1) -> List[Image]:
+    """
+    Function to detect and draw landmarks on many Images. Decode, rescale and color conversion run on a thread pool
+    while detection stays serialized on the calling thread through one shared Holistic model (the model is
+    stateful), so preparation of the next Images overlaps with detection on the current one.
+
+    :param sources: List of Images or paths to Images.
+    :param rescale: What percentage of the size of the original Images will be the output Images.
+    :param workers: Number of threads preparing Images.
+    :param min_detection_confidence: Minimum detection confidence for detecting model (Holistic mediapipe).
+    :param min_tracking_confidence: Minimum tracking confidence for detecting model (Holistic mediapipe).
+    :param points_color: Color of landmarks.
+    :param points_thickness: Thickness of landmarks.
+    :param points_radius: Radius of landmarks.
+    :param connect_color: Color of landmarks' connections.
+    :param connect_thickness: Thickness of landmarks' connections.
+    :param connect_radius: Landmarks' connections.
+    :raises PathToImageIsIncorrectError: Path passed to function is not path to Image.
+    :raises ImageNotExistsError: Image is None.
+    :return: List of Images with drawn landmarks where detected.
+    """
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        with _make_holistic(
+                min_detection_confidence=min_detection_confidence, min_tracking_confidence=min_tracking_confidence
+        ) as holistic:
+            return [
+                detect_and_draw_landmarks(
+                    img_rgb, min_detection_confidence, min_tracking_confidence, points_color, points_thickness,
+                    points_radius, connect_color, connect_thickness, connect_radius, holistic=holistic
+                )
+                for img_rgb in executor.map(functools.partial(_load_and_prep, rescale=rescale), sources)
+            ]
+
+
 def img_mirror(source: str | Image, destination_path: str = None) -> Image:
     """
     Function to mirror and save input image if you want to.
@@ -241,13 +616,35 @@ def img_mirror(source: str | Image, destination_path: str = None) -> Image:
     :param destination_path: If you give destination path to save, mirrored image will be saved there.
     :raises PathToImageIsIncorrectError: Path passed to function is not path to Image.
     :raises ImageNotExistsError: Image is None.
-    :return: Mirrored Image.
+    :return: Mirrored Image. Without destination path it is a zero-copy view into the input - copy with
+    np.ascontiguousarray before passing it to consumers which require C-contiguous input (e.g. Holistic).
     """
 
     img = open_img(source)
-    img_mirrored = np.flip(img, axis=1)
 
     if destination_path:
+        # Saving needs a contiguous buffer anyway, so materialize it with the SIMD flip and return that.
+        img_mirrored = cv2.flip(img, 1)
         cv2.imwrite(destination_path, img_mirrored)
+        return img_mirrored
+
+    return img[:, ::-1]
+
+
+def img_mirror_batch(batch: np.ndarray) -> np.ndarray:
+    """
+    Function to mirror batch of Images in one call. Whole batch is flipped by compiled numba kernel, so per-image
+    dispatch overhead is skipped - useful for bulk dataset preprocessing. Numba is imported here, so it is required
+    only when this function is used.
+
+    :param batch: Batch of Images in format (N, H, W, C).
+    :return: Batch of mirrored Images with the same shape.
+    """
+
+    from src.modules._kernels import _flip_horizontal_batch
+
+    batch = np.ascontiguousarray(batch)
+    mirrored = np.empty_like(batch)
+    _flip_horizontal_batch(batch, mirrored)
 
-    return img_mirrored
+    return mirrored